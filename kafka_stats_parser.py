@@ -21,14 +21,59 @@ Example:
 
 import json
 import argparse
+import functools
+import importlib.util
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib import ticker as mticker
+from typing import List, Dict, Any, Optional, Iterator
 import os
 import re
+import time
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional; it parses several times faster than the stdlib
+    _json_loads = json.loads
+
+_WHITESPACE_RE = re.compile(r'\s*')
+# Broker name parts used for legend labels, and unsafe filename characters
+_GRP_RE = re.compile(r'(g\d{3,})')
+_BID_RE = re.compile(r'/(\d+)$')
+_SLUG_RE = re.compile(r'[^A-Za-z0-9._-]+')
+# Y-axis labels of discrete/count metrics, which get integer ticks
+_INT_YLABEL_RE = re.compile(r'count|epoch|state|offset|lag', re.IGNORECASE)
+# Broker state plotted as a number (unknown states become NaN)
+_STATE_TO_CODE = {"UP": 1, "INIT": 0, "DOWN": -1}
+# Metrics derived as fractional numbers (millisecond averages, MB/s rates); all
+# others hold whole numbers from the stats, written as integers in debug files
+_FLOAT_METRICS = frozenset({'rtt', 'throttle', 'rx_rate', 'tx_rate'})
+# Shared read-only default for missing nested stats objects (never mutated)
+_EMPTY: Dict[str, Any] = {}
+# Formats of the per-plot debug values files (parquet requires polars)
+_DEBUG_FORMATS = ('csv', 'parquet')
+
+# Fixed figure margins (inches, except the right edge which leaves room for the
+# outside legends); applied with subplots_adjust instead of tight_layout
+_MARGIN_LEFT_IN = 1.0
+_MARGIN_BOTTOM_IN = 0.8
+_MARGIN_TOP_IN = 0.5
+_AXES_RIGHT = 0.57
+_AXES_HSPACE = 0.11
+_SAVE_DPI = 100
+# Look shared by every plotted series (line width is a _plot_data argument),
+# and the marker size used for sparse series
+_LINE_STYLE = {'linestyle': '-', 'alpha': 0.8}
+_MARKER_SIZE = 3
+# zlib level for PNG output: most of level 1's speed, much of level 6's size
+_PNG_COMPRESS_LEVEL = 3
+# Figures kept by _render_figure for reuse in pool workers, keyed by (figsize,
+# subplot count); it lives as long as the worker, while serial rendering passes
+# a cache of its own that is dropped once the graphs are written
+_FIGURE_CACHE: Dict[tuple, Any] = {}
 
 
 class RdKafkaStats:
@@ -39,20 +84,23 @@ class RdKafkaStats:
     information about all brokers and topics/partitions known to the client.
     
     Attributes:
-        data (dict): Raw statistics dictionary from librdkafka
+        name (str): Client instance name (e.g. 'rdkafka#consumer-1')
         ts (int): Timestamp in microseconds since epoch
         time (int): Timestamp in seconds since epoch
         type (str): Client type ('producer' or 'consumer')
         brokers (dict): Map of broker names to BrokerStats objects
         topics (dict): Map of topic names to TopicStats objects
     """
+    __slots__ = ('name', 'ts', 'time', 'type', 'brokers', 'topics')
+
     def __init__(self, data: Dict[str, Any]):
-        self.data = data
-        self.ts = data.get('ts')
-        self.time = data.get('time')
-        self.type = data.get('type')
-        self.brokers = {name: BrokerStats(bdata) for name, bdata in data.get('brokers', {}).items()}
-        self.topics = {name: TopicStats(tdata) for name, tdata in data.get('topics', {}).items()}
+        g = data.get
+        self.name = g('name')
+        self.ts = g('ts')
+        self.time = g('time')
+        self.type = g('type')
+        self.brokers = {name: BrokerStats(bdata) for name, bdata in (g('brokers') or _EMPTY).items()}
+        self.topics = {name: TopicStats(tdata) for name, tdata in (g('topics') or _EMPTY).items()}
 
 
 class BrokerStats:
@@ -63,7 +111,6 @@ class BrokerStats:
     communication with a specific broker.
     
     Attributes:
-        data (dict): Raw broker statistics dictionary
         name (str): Broker identifier (usually host:port/id)
         source (str): Either 'logical' or actual broker
         state (str): Connection state ('UP', 'DOWN', 'INIT')
@@ -77,20 +124,23 @@ class BrokerStats:
         rtt_avg (int): Average round-trip time in microseconds
         throttle_avg (int): Average throttle time in microseconds
     """
+    __slots__ = ('name', 'source', 'state', 'connects', 'disconnects', 'rxbytes', 'txbytes',
+                 'rxerrs', 'txerrs', 'req_timeouts', 'rtt_avg', 'throttle_avg')
+
     def __init__(self, data: Dict[str, Any]):
-        self.data = data
-        self.name = data.get('name')
-        self.source = data.get('source')
-        self.state = data.get('state')
-        self.connects = data.get('connects', 0)
-        self.disconnects = data.get('disconnects', 0)
-        self.rxbytes = data.get('rxbytes', 0)
-        self.txbytes = data.get('txbytes', 0)
-        self.rxerrs = data.get('rxerrs', 0)
-        self.txerrs = data.get('txerrs', 0)
-        self.req_timeouts = data.get('req_timeouts', 0)
-        self.rtt_avg = data.get('rtt', {}).get('avg')
-        self.throttle_avg = data.get('throttle', {}).get('avg')
+        g = data.get
+        self.name = g('name')
+        self.source = g('source')
+        self.state = g('state')
+        self.connects = g('connects', 0)
+        self.disconnects = g('disconnects', 0)
+        self.rxbytes = g('rxbytes', 0)
+        self.txbytes = g('txbytes', 0)
+        self.rxerrs = g('rxerrs', 0)
+        self.txerrs = g('txerrs', 0)
+        self.req_timeouts = g('req_timeouts', 0)
+        self.rtt_avg = (g('rtt') or _EMPTY).get('avg')
+        self.throttle_avg = (g('throttle') or _EMPTY).get('avg')
 
 
 class TopicStats:
@@ -101,14 +151,15 @@ class TopicStats:
     known to this client.
     
     Attributes:
-        data (dict): Raw topic statistics dictionary
         topic (str): Topic name
         partitions (dict): Map of partition IDs to PartitionStats objects
     """
+    __slots__ = ('topic', 'partitions')
+
     def __init__(self, data: Dict[str, Any]):
-        self.data = data
-        self.topic = data.get('topic')
-        self.partitions = {pid: PartitionStats(pdata) for pid, pdata in data.get('partitions', {}).items()}
+        g = data.get
+        self.topic = g('topic')
+        self.partitions = {pid: PartitionStats(pdata) for pid, pdata in (g('partitions') or _EMPTY).items()}
 
 
 class PartitionStats:
@@ -122,7 +173,6 @@ class PartitionStats:
         -1001: Invalid/unset offset value
     
     Attributes:
-        data (dict): Raw partition statistics dictionary
         partition (int): Partition number (-1 if not assigned)
         leader (int): Broker ID of the partition leader
         consumer_lag (int): Number of messages behind the high water mark
@@ -131,15 +181,501 @@ class PartitionStats:
         stored_offset (int): Last stored offset (may differ from committed)
         committed_leader_epoch (int): Epoch of the partition leader at commit time
     """
+    __slots__ = ('partition', 'leader', 'consumer_lag', 'consumer_lag_stored',
+                 'committed_offset', 'stored_offset', 'committed_leader_epoch')
+
     def __init__(self, data: Dict[str, Any]):
-        self.data = data
-        self.partition = data.get('partition')
-        self.leader = data.get('leader')
-        self.consumer_lag = data.get('consumer_lag', -1)
-        self.consumer_lag_stored = data.get('consumer_lag_stored', -1)
-        self.committed_offset = data.get('committed_offset', -1001)
-        self.stored_offset = data.get('stored_offset', -1001)
-        self.committed_leader_epoch = data.get('committed_leader_epoch', -1)
+        g = data.get
+        self.partition = g('partition')
+        self.leader = g('leader')
+        self.consumer_lag = g('consumer_lag', -1)
+        self.consumer_lag_stored = g('consumer_lag_stored', -1)
+        self.committed_offset = g('committed_offset', -1001)
+        self.stored_offset = g('stored_offset', -1001)
+        self.committed_leader_epoch = g('committed_leader_epoch', -1)
+
+
+def _fill_broker_metrics(rxbytes, txbytes, rtt, throttle, times, out_rx_rate, out_tx_rate):
+    """
+    Compute derived broker metrics for all brokers in place.
+    
+    All matrices are float64 with one row per snapshot and one column per
+    broker. RTT and throttle are converted from microseconds to milliseconds,
+    and RX/TX rates in MB/s are derived from the cumulative byte counters.
+    A counter that goes down (reset) yields a rate of 0, and a snapshot whose
+    time did not advance uses a time delta of 1 second.
+    
+    This is the NumPy implementation; when Numba is installed,
+    _broker_metrics_kernel() compiles the equivalent loop below instead.
+    
+    Args:
+        rxbytes: Cumulative received bytes (0 where the broker is missing)
+        txbytes: Cumulative transmitted bytes (0 where the broker is missing)
+        rtt: Average RTT in microseconds, converted in place
+        throttle: Average throttle time in microseconds, converted in place
+        times: Snapshot timestamps in seconds since epoch (1-D)
+        out_rx_rate: Output matrix for RX rate in MB/s
+        out_tx_rate: Output matrix for TX rate in MB/s
+    """
+    rtt /= 1000
+    throttle /= 1000
+    prev_times = np.concatenate((times[:1], times[:-1]))
+    time_deltas = np.where((prev_times != 0) & (times > prev_times), times - prev_times, 1)[:, None]
+    out_rx_rate[:] = np.maximum(np.diff(rxbytes, axis=0, prepend=rxbytes[:1]), 0) / time_deltas / (1024*1024)
+    out_tx_rate[:] = np.maximum(np.diff(txbytes, axis=0, prepend=txbytes[:1]), 0) / time_deltas / (1024*1024)
+
+
+def _fill_broker_metrics_loop(rxbytes, txbytes, rtt, throttle, times, out_rx_rate, out_tx_rate):
+    """Explicit-loop form of _fill_broker_metrics, written to be compiled by Numba."""
+    n, m = rxbytes.shape
+    for i in range(n):
+        if i > 0 and times[i - 1] != 0 and times[i] > times[i - 1]:
+            time_delta = times[i] - times[i - 1]
+        else:
+            time_delta = 1.0
+        for j in range(m):
+            rtt[i, j] /= 1000
+            throttle[i, j] /= 1000
+            rx_delta = rxbytes[i, j] - rxbytes[i - 1, j] if i > 0 else 0.0
+            tx_delta = txbytes[i, j] - txbytes[i - 1, j] if i > 0 else 0.0
+            out_rx_rate[i, j] = (rx_delta if rx_delta > 0 else 0.0) / time_delta / (1024*1024)
+            out_tx_rate[i, j] = (tx_delta if tx_delta > 0 else 0.0) / time_delta / (1024*1024)
+
+
+@functools.lru_cache(maxsize=None)
+def _broker_metrics_kernel():
+    """
+    Return the function computing derived broker metrics.
+    
+    Numba is imported here, on first use, rather than with the module, so
+    the summary-only and --help paths do not pay for importing it.
+    
+    Returns:
+        The Numba-compiled _fill_broker_metrics_loop if Numba is installed,
+        otherwise the NumPy _fill_broker_metrics
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        # Numba is optional; without it the NumPy implementation is used
+        return _fill_broker_metrics
+    return njit(cache=True)(_fill_broker_metrics_loop)
+
+
+def _local_datetime64(times):
+    """
+    Convert epoch seconds to naive local wall-clock times, vectorized.
+    
+    Equivalent to datetime.fromtimestamp() for each element, but looks up
+    the UTC offset only once per 15-minute slot (every DST transition falls
+    on a 15-minute boundary) instead of once per snapshot.
+    
+    Args:
+        times: 1-D array of timestamps in seconds since epoch
+        
+    Returns:
+        numpy datetime64[s] array of local times
+    """
+    epoch = np.asarray(times, dtype=np.int64)
+    slots, inverse = np.unique(epoch // 900, return_inverse=True)
+    offsets = np.array([time.localtime(int(slot) * 900).tm_gmtoff for slot in slots], dtype=np.int64)
+    return (epoch + offsets[inverse]).astype('datetime64[s]')
+
+
+def _sentinel_mask(arr):
+    """
+    Flag the librdkafka 'Not Assigned' sentinels (-1 and -1001) in a series.
+    
+    This single vectorized test is the one definition of 'Not Assigned'
+    shared by plotting, statistics and debug output.
+    
+    Args:
+        arr: float64 array of metric values
+        
+    Returns:
+        Boolean array, True where the value is a sentinel
+    """
+    return (arr == -1.0) | (arr == -1001.0)
+
+
+def _mask_sentinels(values):
+    """
+    Mask the samples of a series that hold no plottable value.
+    
+    NaN (metric missing from a snapshot) and the librdkafka 'Not Assigned'
+    sentinels -1 and -1001 are masked, so count(), min() and max() on the
+    result only see valid data.
+    
+    Args:
+        values: Array (any shape) of metric values
+        
+    Returns:
+        numpy masked array sharing the input's float64 data
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    return np.ma.masked_where(np.isnan(arr) | _sentinel_mask(arr), arr, copy=False)
+
+
+def _whole_as_int(values):
+    """
+    Return an object array of the values with whole numbers as Python ints.
+    
+    Series are stored as float64, so integer metrics (offsets, counters)
+    would otherwise be written as e.g. 10000000050.0 in debug output.
+    NaN and fractional values are kept as floats.
+    
+    Args:
+        values: Array-like of numbers
+        
+    Returns:
+        numpy object array with the same shape as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = values.astype(object)
+    whole = np.isfinite(values) & (values == np.trunc(values))
+    out[whole] = values[whole].astype(np.int64)
+    return out
+
+
+def _m4_indices(x, y, n_buckets: int):
+    """
+    Select the sample indices kept by M4 aggregation of a line series.
+    
+    Samples are grouped into n_buckets equal-width bins along x, and the
+    first, last, minimum and maximum sample of each bin are kept. Rendered
+    at n_buckets / 4 pixels wide or less, the reduced series draws the same
+    pixels as the full one. NaN samples never count as a bin's min/max but
+    may still be kept as first/last, so gaps keep breaking the line.
+    
+    Args:
+        x: Sorted 1-D float array of sample positions (e.g. matplotlib dates)
+        y: 1-D float array of sample values, same length as x
+        n_buckets: Number of bins along x
+        
+    Returns:
+        Sorted array of unique indices into x and y
+    """
+    span = x[-1] - x[0]
+    if span > 0:
+        bins = np.minimum(((x - x[0]) / span * n_buckets).astype(np.intp), n_buckets - 1)
+    else:
+        bins = np.zeros(len(x), dtype=np.intp)
+    starts = np.flatnonzero(np.diff(bins, prepend=-1))
+    ends = np.append(starts[1:], len(x)) - 1
+    # Sorting by (bin, value) puts each bin's min (or max) at the bin's start offset
+    nan_mask = np.isnan(y)
+    by_min = np.lexsort((np.where(nan_mask, np.inf, y), bins))[starts]
+    by_max = np.lexsort((np.where(nan_mask, np.inf, -y), bins))[starts]
+    return np.unique(np.concatenate((starts, ends, by_min, by_max)))
+
+
+def _apply_fixed_layout(fig) -> None:
+    """
+    Position a stacked-subplot figure's axes using fixed margins.
+    
+    Stands in for tight_layout(), which measures every tick label and legend
+    to solve the layout on each call. Margins are kept constant in inches so
+    figures of different heights get the same spacing.
+    
+    Args:
+        fig: Matplotlib figure whose subplots should be positioned
+    """
+    width, height = fig.get_size_inches()
+    fig.subplots_adjust(left=_MARGIN_LEFT_IN / width, right=_AXES_RIGHT,
+                        bottom=_MARGIN_BOTTOM_IN / height, top=1 - _MARGIN_TOP_IN / height,
+                        hspace=_AXES_HSPACE)
+
+
+# Unbounded: one entry per broker name, reused by every broker axes
+@functools.lru_cache(maxsize=None)
+def _pretty_broker_label(name: str) -> str:
+    """
+    Convert raw broker name to human-friendly label.
+    
+    Examples:
+    - 'hostname:9092/5' -> 'Broker #5 (g005)'
+    - 'hostname:9092/bootstrap' -> 'Bootstrap'
+    
+    Args:
+        name: Raw broker identifier from librdkafka
+        
+    Returns:
+        Human-readable broker label
+    """
+    if name.endswith('/bootstrap'):
+        return 'Bootstrap'
+    grp_match = _GRP_RE.search(name)
+    id_match = _BID_RE.search(name)
+    grp = grp_match.group(1) if grp_match else None
+    bid = id_match.group(1) if id_match else None
+    if bid and grp:
+        return f"Broker #{bid} ({grp})"
+    if bid:
+        return f"Broker #{bid}"
+    return name
+
+
+def _line_segments(x, y):
+    """
+    Split a line series into its drawable NaN-free runs.
+    
+    A NaN sample breaks a line, so each run of consecutive non-NaN samples
+    becomes one segment. A single-sample run draws nothing, as with Line2D,
+    but is kept so it still counts towards the axes' data limits.
+    
+    Args:
+        x: 1-D float array of x positions
+        y: 1-D float array of values, same length as x
+        
+    Returns:
+        List of (n, 2) vertex arrays, one per run
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], ~np.isnan(y), [0])).astype(np.int8)))
+    xy = np.column_stack((x, y))
+    return [xy[start:stop] for start, stop in zip(edges[::2], edges[1::2])]
+
+
+def _plot_data(ax, x, title, ylabel, data_map, drawstyle='default', center_y=False, 
+               name_transform=None, show_valid=False, linewidth=3.0, downsample_cache=None):
+    """
+    Plot a single metric across multiple series.
+    
+    Handles special cases like constant values, sparse data, and sentinel
+    values (-1, -1001). Automatically adds markers for series with < 2
+    valid points and adjusts y-axis scaling intelligently.
+    
+    Args:
+        ax: Matplotlib axes object to plot on
+        x: Matplotlib date numbers shared by every series
+        title: Plot title
+        ylabel: Y-axis label
+        data_map: Dictionary mapping series names to value lists
+        drawstyle: Matplotlib drawstyle ('default', 'steps-post', etc.)
+        center_y: If True, center y-axis around data (vs bottom at 0)
+        name_transform: Function to transform series names for display
+        show_valid: If True, show data point counts in legend
+        linewidth: Width of plot lines
+        downsample_cache: Optional dict reused across calls to cache M4 indices,
+            keyed by series array id (only valid while those arrays are alive)
+    """
+    # Matplotlib is imported lazily so the summary-only CLI path never loads it
+    import matplotlib
+    from matplotlib import ticker as mticker
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+
+    ax.clear()
+    # clear() keeps the old data limits until an artist is added; an axes whose
+    # series are all empty adds none, and the shared x autoscale would then pick
+    # up whatever this (reused) axes drew before, so reset them
+    ax.relim()
+    ax.set_title(title); ax.set_ylabel(ylabel)
+    # Running y range over the valid points of every series, for axis scaling
+    min_val, max_val = np.inf, -np.inf
+    # M4 bucket count for this axes: 4 buckets per horizontal pixel
+    n_buckets = int(4 * ax.figure.get_size_inches()[0] * ax.figure.dpi)
+    # Plain line series are batched into one LineCollection (one artist per
+    # axes instead of one Line2D each); legend entries use proxy handles
+    colors = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+    segments, segment_colors, handles = [], [], []
+    # Line style used by the LineCollection, the legend proxies and, through the
+    # prop cycle, the ax.plot series, whose calls then only pass what varies per
+    # series (ax.clear() resets the cycle, so it is set every time)
+    line_style = dict(_LINE_STYLE, linewidth=linewidth)
+    ax.set_prop_cycle(markersize=[_MARKER_SIZE], **{k: [v] for k, v in line_style.items()})
+    
+    for i, (name, values) in enumerate(data_map.items()):
+        label_name = name_transform(name) if name_transform else name
+        arr = np.asarray(values, dtype=np.float64)
+        # One sentinel mask drives the counts, the label and the NaN substitution
+        na_mask = _sentinel_mask(arr)
+        nan_mask = np.isnan(arr)
+        # Filter out -1 and -1001 (Not Assigned) for valid point counting
+        valid = arr[~(na_mask | nan_mask)]
+        n_valid = int(valid.size)
+        # Per-series bounds, reused for the constant check and the y range
+        lo, hi = (valid.min(), valid.max()) if n_valid else (np.inf, -np.inf)
+        const_val = float(lo) if n_valid and lo == hi else None
+        # Use markers for sparse data (< 2 points won't draw a line)
+        marker = 'o' if n_valid < 2 else None
+        markersize = _MARKER_SIZE if marker else None
+        
+        # Check if all values are "Not Assigned" (-1 or -1001)
+        not_assigned_count = int(np.count_nonzero(na_mask))
+        all_not_assigned = not_assigned_count == arr.size
+        
+        # Build legend label with optional data point information
+        if show_valid:
+            if all_not_assigned:
+                # All values are "Not Assigned"
+                label = f"{label_name} (Not Assigned)"
+            elif const_val is not None:
+                # Constant value - show it in legend with intelligent formatting
+                if abs(const_val) >= 1000:
+                    # Large values (like offsets): show as integer with commas
+                    const_str = f"{int(const_val):,}"
+                elif abs(const_val) < 0.01 and const_val != 0:
+                    # Very small non-zero values: scientific notation
+                    const_str = f"{const_val:.2e}"
+                else:
+                    # Normal range: 2 decimal places
+                    const_str = f"{const_val:.2f}"
+                label = f"{label_name} ({n_valid} data points, constant={const_str})"
+            else:
+                # Varying values - just show count
+                label = f"{label_name} ({n_valid} data points)"
+        else:
+            label = f"{label_name}"
+        
+        color = colors[i % len(colors)]
+        if n_valid == 0:
+            # Nothing to draw (e.g. all "Not Assigned"): legend entry only
+            handles.append(Line2D([], [], color=color, marker=marker, markersize=markersize,
+                                  label=label, **line_style))
+            continue
+        
+        # Replace -1 and -1001 with np.nan for plotting (won't draw line through them);
+        # series without sentinels are plotted from the array as-is, with no copy
+        plot_values = np.where(na_mask, np.nan, arr) if not_assigned_count else arr
+        
+        # Long series: keep only the M4 points (first/min/max/last per bucket),
+        # which renders identically; x is shared, precomputed date numbers
+        plot_x = x
+        if plot_values.size > n_buckets:
+            keep = None
+            if downsample_cache is not None:
+                m4_key = (id(values), n_buckets)
+                keep = downsample_cache.get(m4_key)
+            if keep is None:
+                keep = _m4_indices(x, plot_values, n_buckets)
+                if downsample_cache is not None:
+                    downsample_cache[m4_key] = keep
+            plot_x, plot_values = x[keep], plot_values[keep]
+        
+        # Use linewidth and no fill to ensure clean line plots
+        if marker is None and drawstyle == 'default':
+            runs = _line_segments(plot_x, plot_values)
+            segments.extend(runs)
+            segment_colors.extend([color] * len(runs))
+            handles.append(Line2D([], [], color=color, label=label, **line_style))
+        else:
+            # Markers and step drawstyles need a Line2D of their own
+            handles.extend(ax.plot(plot_x, plot_values, marker=marker, drawstyle=drawstyle,
+                                   color=color, label=label))
+        min_val, max_val = min(min_val, lo), max(max_val, hi)
+    if segments:
+        # Same look and stacking as Line2D (collections default to below the grid)
+        ax.add_collection(LineCollection(segments, colors=segment_colors, capstyle='projecting',
+                                         joinstyle='round', zorder=2, **line_style))
+        
+    ax.grid(True); ax.legend(handles=handles, loc='upper left', bbox_to_anchor=(1.02, 1), fontsize='small')
+    ax.tick_params(axis='x', rotation=30, labelsize='small')
+    # Friendly time axis formatting (x values are matplotlib date numbers)
+    # (the date locator/formatter are set once per figure by _render_figure)
+    ax.xaxis_date()
+    
+    if min_val > max_val:
+        ax.text(0.5, 0.5, 'No Data Available', horizontalalignment='center', 
+               verticalalignment='center', transform=ax.transAxes)
+        return
+
+    # Intelligent y-axis scaling based on data characteristics
+    min_val, max_val = float(min_val), float(max_val)
+    if center_y:
+        if max_val > min_val:
+            # Values vary - use 10% margin
+            margin = (max_val - min_val) * 0.1
+        else:
+            # Constant value - use percentage of absolute value or minimum visible range
+            if abs(min_val) > 10:
+                # For large values (like offsets in millions), use 0.1% margin
+                margin = abs(min_val) * 0.001
+            else:
+                # For small values near zero, use fixed small margin
+                margin = max(1.0, abs(min_val) * 0.1)
+        ax.set_ylim(bottom=min_val - margin, top=max_val + margin)
+    else:
+        # For non-centered (like lag metrics), ensure we can see the lines
+        if max_val == min_val:
+            # Constant value - add visible margin above and below
+            if min_val == 0:
+                # For zero, center it in view with equal margins above and below
+                ax.set_ylim(bottom=-0.5, top=0.5)
+            elif min_val < 10:
+                # For small values, use symmetric range around the value
+                margin = max(abs(min_val) * 0.5, 2.0)
+                ax.set_ylim(bottom=min_val - margin, top=min_val + margin)
+            else:
+                margin = max(abs(min_val) * 0.1, 1.0)
+                ax.set_ylim(bottom=max(0, min_val - margin), top=min_val + margin)
+        else:
+            ax.autoscale(enable=True, axis='y')
+    # Prefer integer ticks for discrete/count metrics
+    if _INT_YLABEL_RE.search(ylabel):
+        ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
+
+
+def _render_figure(spec: Dict[str, Any], downsample_cache: Optional[Dict] = None,
+                   figure_cache: Optional[Dict] = None) -> str:
+    """
+    Draw one stacked-subplot figure and save it as a PNG.
+    
+    Module-level (and building its own Figure rather than going through
+    pyplot) so it can run in a worker process: the spec holds only plain
+    data, which pickles, while figures do not. A figure with the same size
+    and subplot count is reused from earlier calls, its axes being cleared
+    and redrawn, since creating figures and axes is costly.
+    
+    Args:
+        spec: Figure description with keys:
+            - path: Output PNG path
+            - figsize: (width, height) in inches
+            - x: Matplotlib date numbers for the x axis
+            - subplots: List of keyword dicts for _plot_data, each optionally
+              carrying 'annotation' (corner text), 'ylim_bottom' and
+              'state_ticks' (label the y axis DOWN/INIT/UP)
+        downsample_cache: Optional M4 index cache passed to _plot_data
+        figure_cache: Dict of reusable figures keyed by layout; defaults to
+            the process-wide _FIGURE_CACHE used by pool workers
+        
+    Returns:
+        Path of the written PNG file
+    """
+    # Figure renders through Agg directly (no pyplot, so no GUI backend)
+    import matplotlib.dates as mdates
+    from matplotlib.figure import Figure
+
+    if figure_cache is None:
+        figure_cache = _FIGURE_CACHE
+    layout = (tuple(spec['figsize']), len(spec['subplots']))
+    if layout not in figure_cache:
+        fig = Figure(figsize=spec['figsize'])
+        axes = fig.subplots(len(spec['subplots']), 1, sharex=True, squeeze=False)[:, 0]
+        _apply_fixed_layout(fig)
+        figure_cache[layout] = (fig, axes)
+    fig, axes = figure_cache[layout]
+    for ax, subplot in zip(axes, spec['subplots']):
+        opts = dict(subplot)
+        annotation = opts.pop('annotation', None)
+        ylim_bottom = opts.pop('ylim_bottom', None)
+        state_ticks = opts.pop('state_ticks', False)
+        _plot_data(ax, spec['x'], downsample_cache=downsample_cache, **opts)
+        if annotation:
+            ax.text(0.01, 0.02, annotation, transform=ax.transAxes, fontsize='x-small', alpha=0.7)
+        if ylim_bottom is not None:
+            ax.set_ylim(bottom=ylim_bottom)
+        if state_ticks:
+            # Broker state is discrete: DOWN/INIT/UP
+            ax.set_yticks([-1, 0, 1])
+            ax.set_yticklabels(['DOWN', 'INIT', 'UP'])
+            ax.set_ylim(bottom=-1.5, top=1.5)
+    # The subplots share one x axis ticker, so a single date locator/formatter
+    # serves them all; set after drawing, since ax.clear() resets that ticker
+    locator = mdates.AutoDateLocator(minticks=3, maxticks=8)
+    axes[-1].xaxis.set_major_locator(locator)
+    axes[-1].xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    fig.savefig(spec['path'], dpi=_SAVE_DPI, pil_kwargs={'compress_level': _PNG_COMPRESS_LEVEL})
+    return spec['path']
 
 
 class LibrdKafkaStatsParser:
@@ -163,6 +699,90 @@ class LibrdKafkaStatsParser:
         """
         self.stats_file = stats_file
         self.stats_history: List[RdKafkaStats] = self._load_stats()
+        # Time-series extraction is pure, so it is computed once per history
+        # (keyed by identity and length) and reused by later graph/debug calls,
+        # together with the M4 downsampling indices of its series
+        self._time_series_cache = None
+        self._downsample_cache: Dict[tuple, np.ndarray] = {}
+
+    @staticmethod
+    def _iter_json_values(f) -> Iterator[Any]:
+        """
+        Lazily yield top-level JSON values from a binary file object.
+        
+        Lines that hold a complete value (newline-delimited JSON, the usual
+        shape of a stats log) are parsed directly. Anything else, such as
+        pretty-printed or back-to-back objects, is buffered. A buffer holding
+        exactly one value (a pretty-printed object or array) is parsed in one
+        call; otherwise it is drained with an incremental raw_decode. A failed
+        decode is only retried once the buffer has doubled or a line closes a
+        top-level value, so values that span many lines are still parsed in
+        linear time. A multi-line top-level array is read to the end of the
+        file and parsed in one go.
+        
+        Parsing stops silently at the first value that cannot be decoded.
+        
+        Args:
+            f: File object opened in binary mode
+        
+        Yields:
+            Decoded JSON values (dicts, or lists for a JSON array file)
+        """
+        decoder = json.JSONDecoder()
+        # Buffered lines stay bytes: the fast parser takes them without decoding
+        pending: List[bytes] = []
+        pending_len = 0
+        retry_len = 0
+        lines = iter(f)
+        while True:
+            line = next(lines, None)
+            if line is not None:
+                if not pending:
+                    if not line.strip(): continue
+                    try:
+                        yield _json_loads(line)
+                        continue
+                    except json.JSONDecodeError:
+                        pass
+                    if line.lstrip()[:1] == b'[':
+                        # A top-level array is normally the whole file: read it at
+                        # once, as retrying while it grows would re-decode the
+                        # incomplete array every time
+                        line += f.read()
+                pending.append(line)
+                pending_len += len(line)
+                if pending_len < retry_len and line[:1] not in (b'}', b']'):
+                    continue
+            if pending:
+                data = b''.join(pending)
+                # Usual case for pretty-printed files: the buffer is one whole
+                # value, which the fast parser (orjson if present) can take at once
+                try:
+                    obj = _json_loads(data)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    yield obj
+                    pending, pending_len, retry_len = [], 0, 0
+                    if line is None:
+                        return
+                    continue
+                # Drain every complete value from the buffer, keep the remainder
+                text = data.decode('utf-8')
+                pos = 0
+                while True:
+                    pos = _WHITESPACE_RE.match(text, pos).end()
+                    if pos == len(text): break
+                    try:
+                        obj, pos = decoder.raw_decode(text, pos)
+                    except json.JSONDecodeError: break
+                    yield obj
+                rest = text[pos:].encode('utf-8')
+                pending = [rest] if rest else []
+                pending_len = len(rest)
+                retry_len = 2 * pending_len
+            if line is None:
+                return
 
     def _load_stats(self) -> List[RdKafkaStats]:
         """
@@ -173,77 +793,72 @@ class LibrdKafkaStatsParser:
         2. JSON array of objects
         3. Multiple concatenated JSON objects (one per line or back-to-back)
         
-        After loading, deduplicates records with the same timestamp by merging
+        While loading, deduplicates records with the same timestamp by merging
         their broker and topic data. This handles cases where stats are split
         across multiple JSON objects at the same collection time.
         
         Returns:
             List of RdKafkaStats objects, sorted by timestamp and deduplicated
         """
-        history = []
+        # Deduplicate while loading: records with the same timestamp are merged
+        # into the first one seen. This handles cases where the JSON has multiple
+        # records per timestamp, each potentially containing different topics or brokers
+        seen_timestamps: Dict[int, RdKafkaStats] = {}
+        record_count = 0
         try:
-            with open(self.stats_file, 'r') as f:
-                content = f.read()
-                try:
-                    # Try parsing as single object or array first
-                    stats_list = json.loads(content)
-                    if isinstance(stats_list, list):
-                        for stats_json in stats_list:
-                            history.append(RdKafkaStats(stats_json))
-                    else:
-                        history.append(RdKafkaStats(stats_list))
-                except json.JSONDecodeError:
-                    # Fall back to parsing multiple concatenated JSON objects
-                    decoder = json.JSONDecoder()
-                    pos = 0
-                    while pos < len(content):
-                        content_stripped = content[pos:].lstrip()
-                        if not content_stripped: break
-                        try:
-                            obj, read_len = decoder.raw_decode(content_stripped)
-                            history.append(RdKafkaStats(obj))
-                            pos += (len(content_stripped) - len(content_stripped[read_len:]))
-                        except json.JSONDecodeError: break
+            with open(self.stats_file, 'rb') as f:
+                # Records are converted as they are parsed; only a multi-line
+                # top-level array is held in memory as a whole
+                for stats_json in self._iter_json_values(f):
+                    for record in (stats_json if isinstance(stats_json, list) else [stats_json]):
+                        record_count += 1
+                        record_time = record.get('time')
+                        if record_time is None: continue
+                        existing = seen_timestamps.get(record_time)
+                        if existing is None:
+                            seen_timestamps[record_time] = RdKafkaStats(record)
+                        else:
+                            # Only the parts missing from the existing record are built
+                            self._merge_stats(existing, record)
         except FileNotFoundError:
             print(f"Error: File not found at {self.stats_file}")
             return []
         
-        # Sort by timestamp
-        history.sort(key=lambda s: s.ts if s.ts is not None else 0)
-        
-        # Deduplicate: merge records with the same timestamp
-        # This handles cases where the JSON has multiple records per timestamp,
-        # each potentially containing different topics or brokers
-        seen_timestamps = {}
-        for stat in history:
-            if stat.time is not None:
-                if stat.time in seen_timestamps:
-                    # Merge topics and brokers from this record into the existing one
-                    existing = seen_timestamps[stat.time]
-                    # Merge topics
-                    for topic_name, topic_stats in stat.topics.items():
-                        if topic_name not in existing.topics:
-                            existing.topics[topic_name] = topic_stats
-                        else:
-                            # Merge partitions within the topic
-                            for part_id, part_stats in topic_stats.partitions.items():
-                                if part_id not in existing.topics[topic_name].partitions:
-                                    existing.topics[topic_name].partitions[part_id] = part_stats
-                    # Merge brokers
-                    for broker_name, broker_stats in stat.brokers.items():
-                        if broker_name not in existing.brokers:
-                            existing.brokers[broker_name] = broker_stats
-                else:
-                    seen_timestamps[stat.time] = stat
+        deduplicated = sorted(seen_timestamps.values(), key=lambda s: s.time)
         
-        deduplicated = list(seen_timestamps.values())
-        deduplicated.sort(key=lambda s: s.time if s.time is not None else 0)
-        
-        if len(deduplicated) < len(history):
-            print(f"Deduplicated {len(history)} records down to {len(deduplicated)} unique timestamps (merged data from duplicates)")
+        if len(deduplicated) < record_count:
+            print(f"Deduplicated {record_count} records down to {len(deduplicated)} unique timestamps (merged data from duplicates)")
         
         return deduplicated
 
+    @staticmethod
+    def _merge_stats(existing: RdKafkaStats, record: Dict[str, Any]):
+        """
+        Merge topics and brokers from a duplicate raw record into an existing one.
+        
+        Topics, partitions and brokers already present in the existing record
+        are kept; stats objects are only built for the ones it is missing, so
+        nothing is constructed just to be discarded.
+        
+        Args:
+            existing: Record that was seen first for this timestamp
+            record: Raw statistics dictionary of a later record with the same timestamp
+        """
+        # Merge topics
+        for topic_name, topic_data in (record.get('topics') or _EMPTY).items():
+            topic_stats = existing.topics.get(topic_name)
+            if topic_stats is None:
+                existing.topics[topic_name] = TopicStats(topic_data)
+            else:
+                # Merge partitions within the topic
+                for part_id, part_data in (topic_data.get('partitions') or _EMPTY).items():
+                    if part_id not in topic_stats.partitions:
+                        topic_stats.partitions[part_id] = PartitionStats(part_data)
+        # Merge brokers
+        for broker_name, broker_data in (record.get('brokers') or _EMPTY).items():
+            if broker_name not in existing.brokers:
+                existing.brokers[broker_name] = BrokerStats(broker_data)
+
     def print_summary(self):
         """
         Print a human-readable summary of the most recent statistics.
@@ -261,7 +876,7 @@ class LibrdKafkaStatsParser:
         print("\n--- Latest Statistics Summary ---")
         timestamp_str = datetime.fromtimestamp(latest.time).isoformat() if latest.time else "N/A"
         print(f"Timestamp: {timestamp_str}")
-        print(f"Client: {latest.data.get('name')} ({latest.type})")
+        print(f"Client: {latest.name} ({latest.type})")
         
         print("\nBrokers:")
         for name, broker in sorted(latest.brokers.items()):
@@ -287,83 +902,95 @@ class LibrdKafkaStatsParser:
         
         Returns:
             Dictionary containing:
-            - timestamps: List of datetime objects
+            - timestamps: numpy datetime64[s] array of local snapshot times
+            - timestamps_num: The same times as matplotlib date numbers
             - client_type: 'producer' or 'consumer'
-            - brokers: Dict mapping broker names to metric time series
-            - topics: Dict mapping topics to partitions to metric time series
+            - brokers: Dict mapping broker names to metric arrays (NumPy, NaN where missing)
+            - topics: Dict mapping topics to partitions to metric arrays
             
             Returns None if insufficient data points (< 2)
         """
         if len(self.stats_history) < 2: return None
+        import matplotlib.dates as mdates  # lazy: only needed for graphing
+
+        cache_key = (id(self.stats_history), len(self.stats_history))
+        if self._time_series_cache is not None and self._time_series_cache[0] == cache_key:
+            return self._time_series_cache[1]
 
         plottable_stats = [s for s in self.stats_history if s.time is not None]
-        timestamps = [datetime.fromtimestamp(s.time) for s in plottable_stats]
+        # Sized up front: filled in place, no intermediate list
+        times = np.fromiter((s.time for s in plottable_stats), dtype=np.float64, count=len(plottable_stats))
+        timestamps = _local_datetime64(times)
         
         # Collect all unique broker, topic, and partition keys across all snapshots
-        all_broker_keys, all_topic_keys, all_partition_keys = set(), set(), set()
+        # (partitions are grouped per topic as {"<topic>-<id>": id})
+        all_broker_keys = set()
+        topic_to_parts: Dict[str, Dict[str, str]] = {}
         for s in plottable_stats:
             for b_name, b_stats in s.brokers.items():
                 if b_stats.source != 'logical': all_broker_keys.add(b_name)
             for t_name, t_stats in s.topics.items():
-                all_topic_keys.add(t_name)
+                parts = topic_to_parts.setdefault(t_name, {})
                 for p_id, p_stats in t_stats.partitions.items():
-                    if p_stats.partition != -1: all_partition_keys.add(f"{t_name}-{p_id}")
+                    if p_stats.partition != -1: parts[f"{t_name}-{p_id}"] = p_id
         
-        # Initialize data structure for time series
+        # Initialize data structure for time series (one preallocated array per metric)
+        n = len(plottable_stats)
+        broker_keys = list(all_broker_keys)
+        broker_metrics = ('rtt', 'state', 'throttle', 'connects', 'disconnects', 'rx_rate', 'tx_rate', 'rxerrs', 'txerrs')
+        partition_metrics = ('lag', 'lag_stored', 'committed', 'stored', 'leader_epoch')
+        # Broker metrics are (snapshot, broker) matrices; each broker's series is a column
+        broker_matrix = {m: np.full((n, len(broker_keys)), np.nan) for m in broker_metrics}
+        # Cumulative byte counters used for rate calculation (missing broker counts as 0)
+        rxbytes = np.zeros((n, len(broker_keys)))
+        txbytes = np.zeros((n, len(broker_keys)))
         data = {
-            'timestamps': timestamps, 'client_type': plottable_stats[0].type if plottable_stats else 'unknown',
-            'brokers': {b: {'rtt': [], 'state': [], 'throttle': [], 'connects': [], 'disconnects': [], 'rx_rate': [], 'tx_rate': [], 'rxerrs': [], 'txerrs': [], 'last_rxbytes': None, 'last_txbytes': None} for b in all_broker_keys},
-            'topics': {t: {p: {'lag': [], 'lag_stored': [], 'committed': [], 'stored': [], 'leader_epoch': [], 'leader_last': None} for p in all_partition_keys if p.startswith(t)} for t in all_topic_keys}
+            'timestamps': timestamps, 'timestamps_num': mdates.date2num(timestamps),
+            'client_type': plottable_stats[0].type if plottable_stats else 'unknown',
+            'brokers': {b: {m: broker_matrix[m][:, j] for m in broker_metrics} for j, b in enumerate(broker_keys)},
+            'topics': {t: {p: {**{m: np.full(n, np.nan) for m in partition_metrics}, 'leader_last': None} for p in parts} for t, parts in topic_to_parts.items()}
         }
-        
-        last_time = plottable_stats[0].time if plottable_stats else 0
-        state_map = {"UP": 1, "INIT": 0, "DOWN": -1}
+        state_code = _STATE_TO_CODE.get
 
-        for stats in plottable_stats:
-            # Calculate time delta for rate calculations (MB/s)
-            time_delta = stats.time - last_time if last_time and stats.time > last_time else 1
-            for b_key in all_broker_keys:
+        # First pass: copy raw values out of each snapshot by index
+        for i, stats in enumerate(plottable_stats):
+            for j, b_key in enumerate(broker_keys):
                 broker = stats.brokers.get(b_key)
-                b_data = data['brokers'][b_key]
-                
-                # Collect basic broker metrics
-                b_data['rtt'].append(broker.rtt_avg / 1000 if broker and broker.rtt_avg is not None else np.nan)
-                b_data['state'].append(state_map.get(broker.state, np.nan) if broker else np.nan)
-                b_data['throttle'].append(broker.throttle_avg / 1000 if broker and broker.throttle_avg is not None else np.nan)
-                b_data['connects'].append(broker.connects if broker else np.nan)
-                b_data['disconnects'].append(broker.disconnects if broker else np.nan)
-                b_data['rxerrs'].append(broker.rxerrs if broker else np.nan)
-                b_data['txerrs'].append(broker.txerrs if broker else np.nan)
-
-                # Calculate RX rate in MB/s from cumulative bytes
-                current_rx = broker.rxbytes if broker else 0
-                rx_delta = current_rx - b_data['last_rxbytes'] if b_data['last_rxbytes'] is not None and current_rx >= b_data['last_rxbytes'] else 0
-                b_data['rx_rate'].append(rx_delta / time_delta / (1024*1024))
-                b_data['last_rxbytes'] = current_rx
-
-                # Calculate TX rate in MB/s from cumulative bytes
-                current_tx = broker.txbytes if broker else 0
-                tx_delta = current_tx - b_data['last_txbytes'] if b_data['last_txbytes'] is not None and current_tx >= b_data['last_txbytes'] else 0
-                b_data['tx_rate'].append(tx_delta / time_delta / (1024*1024))
-                b_data['last_txbytes'] = current_tx
+                if broker is None: continue
+                broker_matrix['rtt'][i, j] = broker.rtt_avg
+                broker_matrix['state'][i, j] = state_code(broker.state, np.nan)
+                broker_matrix['throttle'][i, j] = broker.throttle_avg
+                broker_matrix['connects'][i, j] = broker.connects
+                broker_matrix['disconnects'][i, j] = broker.disconnects
+                broker_matrix['rxerrs'][i, j] = broker.rxerrs
+                broker_matrix['txerrs'][i, j] = broker.txerrs
+                rxbytes[i, j] = broker.rxbytes
+                txbytes[i, j] = broker.txbytes
 
             # Collect partition metrics for each topic
-            for t_key in all_topic_keys:
+            for t_key, parts in topic_to_parts.items():
                 topic = stats.topics.get(t_key)
-                for p_key in data['topics'][t_key]:
-                    _, p_id_str = p_key.rsplit('-', 1)
-                    part = topic.partitions.get(p_id_str) if topic else None
-                    p_data = data['topics'][t_key][p_key]
+                if topic is None: continue
+                t_data = data['topics'][t_key]
+                for p_key, p_id in parts.items():
+                    part = topic.partitions.get(p_id)
+                    if part is None: continue
+                    p_data = t_data[p_key]
                     # Keep actual values including -1 and -1001 (we'll display them meaningfully later)
-                    p_data['lag'].append(part.consumer_lag if part else np.nan)
-                    p_data['lag_stored'].append(part.consumer_lag_stored if part else np.nan)
-                    p_data['committed'].append(part.committed_offset if part else np.nan)
-                    p_data['stored'].append(part.stored_offset if part else np.nan)
-                    p_data['leader_epoch'].append(part.committed_leader_epoch if part else np.nan)
+                    p_data['lag'][i] = part.consumer_lag
+                    p_data['lag_stored'][i] = part.consumer_lag_stored
+                    p_data['committed'][i] = part.committed_offset
+                    p_data['stored'][i] = part.stored_offset
+                    p_data['leader_epoch'][i] = part.committed_leader_epoch
                     # Track the last valid leader ID for display purposes
-                    if part and part.leader is not None and part.leader != -1:
+                    if part.leader is not None and part.leader != -1:
                         p_data['leader_last'] = part.leader
-            last_time = stats.time
+
+        # Second pass: derived broker metrics for all brokers at once
+        _broker_metrics_kernel()(rxbytes, txbytes, broker_matrix['rtt'], broker_matrix['throttle'], times,
+                                 broker_matrix['rx_rate'], broker_matrix['tx_rate'])
+        self._time_series_cache = (cache_key, data)
+        self._downsample_cache.clear()
         return data
 
     def write_debug_data(self, data, output_file="debug_data.txt"):
@@ -377,12 +1004,14 @@ class LibrdKafkaStatsParser:
             data: Dictionary of time-series data from _get_time_series_data()
             output_file: Path to write debug output (default: "debug_data.txt")
         """
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
         print(f"Writing debug data to {output_file}...")
         with open(output_file, 'w') as f:
             for category, items in data.items():
                 if category == 'timestamps':
-                    f.write(f"--- TIMESTAMPS ---\n{[ts.isoformat() for ts in items]}\n\n")
+                    f.write(f"--- TIMESTAMPS ---\n{np.datetime_as_string(items).tolist()}\n\n")
+                    continue
+                if category == 'timestamps_num':
                     continue
                 if category == 'client_type':
                     f.write(f"--- CLIENT_TYPE ---\n{items}\n\n")
@@ -391,12 +1020,22 @@ class LibrdKafkaStatsParser:
                 for name, metrics in items.items():
                     f.write(f"  {name}:\n")
                     for metric_name, values in metrics.items():
-                        # Don't write the byte counters used for rate calculation
-                        if 'last_rxbytes' in metric_name or 'last_txbytes' in metric_name:
-                            continue
+                        # Write series as plain lists (ndarray repr elides long arrays),
+                        # with integer metrics as ints
+                        if isinstance(values, dict):
+                            values = {k: self._debug_list(k, v) for k, v in values.items()}
+                        else:
+                            values = self._debug_list(metric_name, values)
                         f.write(f"    {metric_name}: {values}\n")
                     f.write("\n")
 
+    @staticmethod
+    def _debug_list(metric: str, values):
+        """Series as a plain list for the debug dump (other values unchanged)."""
+        if not isinstance(values, np.ndarray):
+            return values
+        return (values if metric in _FLOAT_METRICS else _whole_as_int(values)).tolist()
+
     # ------------------------------
     # Plot-level debug helper methods
     # ------------------------------
@@ -414,7 +1053,7 @@ class LibrdKafkaStatsParser:
         Returns:
             Slugified name safe for filenames
         """
-        return re.sub(r"[^A-Za-z0-9._-]+", "_", name)
+        return _SLUG_RE.sub("_", name)
 
     def _series_stats(self, data_map: Dict[str, List[float]]):
         """
@@ -442,16 +1081,16 @@ class LibrdKafkaStatsParser:
         """
         stats = {}
         for key, values in data_map.items():
-            total = len(values)
-            # Check if all values are "Not Assigned" (-1 or -1001)
-            not_assigned_count = sum(1 for v in values if v == -1 or v == -1001)
             # Valid points exclude NaN and "Not Assigned" values
-            valid_idx = [i for i, v in enumerate(values) if v is not None and not np.isnan(v) and v != -1 and v != -1001]
+            masked = _mask_sentinels(values)
+            invalid = np.ma.getmaskarray(masked)
+            total = len(masked)
+            not_assigned_count = int(np.count_nonzero(_sentinel_mask(masked.data)))
+            valid_idx = np.flatnonzero(~invalid)
             valid = len(valid_idx)
             if valid:
-                vals = [values[i] for i in valid_idx]
-                vmin, vmax = np.min(vals), np.max(vals)
-                constant = bool(np.allclose(vmin, vmax, equal_nan=False))
+                vmin, vmax = masked.min(), masked.max()
+                constant = bool(vmin == vmax)
                 stats[key] = {
                     'total': total,
                     'valid': valid,
@@ -475,12 +1114,16 @@ class LibrdKafkaStatsParser:
                 }
         return stats
 
-    def _write_plot_debug(self, title: str, timestamps: List[datetime], data_map: Dict[str, List[float]], debug_dir: str):
+    def _write_plot_debug(self, title: str, timestamps: np.ndarray, data_map: Dict[str, List[float]], debug_dir: str,
+                          plot_stats: Optional[Dict[str, Dict[str, Any]]] = None, debug_format: str = 'csv',
+                          integer_values: bool = False):
         """
         Write detailed debug information for a specific plot.
         
         Creates two files:
-        1. CSV with exact values plotted (timestamp + all series)
+        1. CSV with exact values plotted (timestamp + all series), or with
+           debug_format='parquet' a zstd-compressed Parquet file holding the
+           raw values (sentinels kept, NaN where missing); requires polars
         2. Text summary with per-series statistics
         
         Also prints console warnings for series that may not be visible due to
@@ -488,33 +1131,45 @@ class LibrdKafkaStatsParser:
         
         Args:
             title: Plot title (used to generate filenames)
-            timestamps: List of datetime objects for x-axis
+            timestamps: numpy datetime64 array of x-axis times
             data_map: Dictionary mapping series names to value lists
-            debug_dir: Directory to write debug files
+            debug_dir: Existing directory to write debug files
+            plot_stats: _series_stats(data_map) if the caller already has it
+            debug_format: 'csv' (default) or 'parquet' for the values file
+            integer_values: If True, whole-number values are written to the CSV
+                as integers (the series are stored as float64)
         """
-        os.makedirs(debug_dir, exist_ok=True)
         slug = self._slugify(title)
-        csv_path = os.path.join(debug_dir, f"{slug}.csv")
         summary_path = os.path.join(debug_dir, f"{slug}.summary.txt")
-
-        # CSV (timestamps + each series)
         series_keys = list(sorted(data_map.keys()))
-        with open(csv_path, 'w', encoding='utf-8') as f:
-            f.write(",".join(["timestamp"] + [self._slugify(k) for k in series_keys]) + "\n")
-            for i, ts in enumerate(timestamps):
-                row = [ts.isoformat()]
-                for k in series_keys:
-                    v = data_map[k][i]
-                    if v is None or np.isnan(v):
-                        row.append("")
-                    elif v == -1 or v == -1001:
-                        row.append("Not Assigned")
-                    else:
-                        row.append(str(v))
-                f.write(",".join(row) + "\n")
+
+        if debug_format == 'parquet':
+            # Columnar dump of the raw series, keyed by their original names
+            import polars as pl  # optional dependency, only needed for Parquet
+            frame = pl.DataFrame({
+                'timestamp': timestamps.astype('datetime64[ms]'),
+                **{k: np.asarray(data_map[k], dtype=np.float64) for k in series_keys},
+            })
+            frame.write_parquet(os.path.join(debug_dir, f"{slug}.parquet"), compression='zstd', compression_level=3)
+        else:
+            # CSV (timestamps + each series)
+            # Format every cell at once: (n_timestamps, n_series) values -> strings
+            values = np.empty((len(timestamps), len(series_keys)))
+            for j, k in enumerate(series_keys):
+                values[:, j] = data_map[k]
+            cells = (_whole_as_int(values) if integer_values else values).astype('U32')
+            # Every masked cell is "Not Assigned" except missing (NaN) ones, left empty
+            cells[np.ma.getmaskarray(_mask_sentinels(values))] = "Not Assigned"
+            cells[np.isnan(values)] = ""
+            iso_times = np.datetime_as_string(timestamps)
+            rows = np.column_stack((iso_times, cells)).tolist()
+            with open(os.path.join(debug_dir, f"{slug}.csv"), 'w', encoding='utf-8') as f:
+                f.write(",".join(["timestamp"] + [self._slugify(k) for k in series_keys]) + "\n")
+                f.write("".join(",".join(row) + "\n" for row in rows))
 
         # Text summary with per-series stats
-        plot_stats = self._series_stats(data_map)
+        if plot_stats is None:
+            plot_stats = self._series_stats(data_map)
         with open(summary_path, 'w', encoding='utf-8') as f:
             f.write(f"Plot: {title}\n")
             f.write(f"Points per series: {len(timestamps)}\n\n")
@@ -553,7 +1208,8 @@ class LibrdKafkaStatsParser:
                 )
 
     def generate_graphs(self, output_dir: str, debug: bool = False, show_empty: bool = False, 
-                       legend_valid: bool = True, annotate: bool = True, line_width: float = 3.0):
+                       legend_valid: bool = True, annotate: bool = True, line_width: float = 3.0,
+                       max_workers: Optional[int] = 1, debug_format: str = 'csv'):
         """
         Generate comprehensive time-series graphs for all metrics.
         
@@ -563,267 +1219,191 @@ class LibrdKafkaStatsParser:
         
         Args:
             output_dir: Directory to save graph PNG files
-            debug: If True, write debug CSV/summary files for each plot
+            debug: If True, write debug CSV (or Parquet)/summary files for each plot
             show_empty: If True, include series with no valid data points
             legend_valid: If True, append data point counts to legend labels
             annotate: If True, add small text annotations showing series counts
             line_width: Width of plot lines in points (default: 3.0)
+            max_workers: Number of processes rendering PNG files in parallel;
+                None uses every CPU, 1 (default) renders serially in-process
+            debug_format: Per-plot debug values format, 'csv' (default) or
+                'parquet' (requires polars)
+        
+        Raises:
+            ValueError: If max_workers is below 1 or debug_format is unknown
+            ImportError: If debug Parquet output is requested without polars
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1 or None, got {max_workers}")
+        if debug_format not in _DEBUG_FORMATS:
+            raise ValueError(f"debug_format must be one of {', '.join(_DEBUG_FORMATS)}, got {debug_format!r}")
+        # Checked before anything is written, not when the first Parquet file is
+        if debug and debug_format == 'parquet' and importlib.util.find_spec("polars") is None:
+            raise ImportError("debug_format='parquet' requires polars (pip install polars)")
         data = self._get_time_series_data()
         if not data:
             print("Not enough data points to generate graphs.")
             return
 
         debug_dir = os.path.join(output_dir, "debug")
+        broker_debug_dir = os.path.join(debug_dir, 'brokers')
+        topic_debug_dir = os.path.join(debug_dir, 'topics')
         if debug:
             # Raw dump plus plot-level CSVs/summaries will be created below
             self.write_debug_data(data, os.path.join(debug_dir, "debug_data.txt"))
+            os.makedirs(broker_debug_dir, exist_ok=True)
+            if data['client_type'] == 'consumer':
+                os.makedirs(topic_debug_dir, exist_ok=True)
 
-        if not os.path.exists(output_dir): os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
         print(f"\nGenerating graphs into directory: {output_dir}...")
 
         timestamps = data['timestamps']
-        
-        def pretty_broker_label(name: str) -> str:
-            """
-            Convert raw broker name to human-friendly label.
-            
-            Examples:
-            - 'hostname:9092/5' -> 'Broker #5 (g005)'
-            - 'hostname:9092/bootstrap' -> 'Bootstrap'
-            
-            Args:
-                name: Raw broker identifier from librdkafka
-                
-            Returns:
-                Human-readable broker label
-            """
-            if name.endswith('/bootstrap'):
-                return 'Bootstrap'
-            grp_match = re.search(r'(g\d{3,})', name)
-            id_match = re.search(r'/(\d+)$', name)
-            grp = grp_match.group(1) if grp_match else None
-            bid = id_match.group(1) if id_match else None
-            if bid and grp:
-                return f"Broker #{bid} ({grp})"
-            if bid:
-                return f"Broker #{bid}"
-            return name
-            
-        def plot_data(ax, title, ylabel, data_map, drawstyle='default', center_y=False, 
-                     name_transform=lambda s: s, show_valid=False, linewidth=3.0):
-            """
-            Plot a single metric across multiple series.
-            
-            Handles special cases like constant values, sparse data, and sentinel
-            values (-1, -1001). Automatically adds markers for series with < 2
-            valid points and adjusts y-axis scaling intelligently.
-            
-            Args:
-                ax: Matplotlib axes object to plot on
-                title: Plot title
-                ylabel: Y-axis label
-                data_map: Dictionary mapping series names to value lists
-                drawstyle: Matplotlib drawstyle ('default', 'steps-post', etc.)
-                center_y: If True, center y-axis around data (vs bottom at 0)
-                name_transform: Function to transform series names for display
-                show_valid: If True, show data point counts in legend
-                linewidth: Width of plot lines
-            """
-            ax.clear()
-            ax.set_title(title); ax.set_ylabel(ylabel)
-            all_values = []
-            
-            for name, values in data_map.items():
-                label_name = name_transform(name)
-                # Filter out -1 and -1001 (Not Assigned) for valid point counting
-                valid_points = [v for v in values if v is not None and not np.isnan(v) and v != -1 and v != -1001]
-                # Use markers for sparse data (< 2 points won't draw a line)
-                marker = 'o' if len(valid_points) < 2 else None
-                markersize = 3 if marker else None
-                
-                # Check if all values are "Not Assigned" (-1 or -1001)
-                not_assigned_count = sum(1 for v in values if v == -1 or v == -1001)
-                all_not_assigned = not_assigned_count == len(values)
-                
-                # Build legend label with optional data point information
-                if show_valid:
-                    if all_not_assigned:
-                        # All values are "Not Assigned"
-                        label = f"{label_name} (Not Assigned)"
-                    elif len(valid_points) > 0 and all(v == valid_points[0] for v in valid_points):
-                        # Constant value - show it in legend with intelligent formatting
-                        const_val = valid_points[0]
-                        if abs(const_val) >= 1000:
-                            # Large values (like offsets): show as integer with commas
-                            const_str = f"{int(const_val):,}"
-                        elif abs(const_val) < 0.01 and const_val != 0:
-                            # Very small non-zero values: scientific notation
-                            const_str = f"{const_val:.2e}"
-                        else:
-                            # Normal range: 2 decimal places
-                            const_str = f"{const_val:.2f}"
-                        label = f"{label_name} ({len(valid_points)} data points, constant={const_str})"
-                    else:
-                        # Varying values - just show count
-                        label = f"{label_name} ({len(valid_points)} data points)"
-                else:
-                    label = f"{label_name}"
-                
-                # Replace -1 and -1001 with np.nan for plotting (won't draw line through them)
-                plot_values = [np.nan if (v == -1 or v == -1001) else v for v in values]
-                
-                # Use linewidth and no fill to ensure clean line plots
-                ax.plot(timestamps, plot_values, linestyle='-', marker=marker, markersize=markersize, 
-                       label=label, drawstyle=drawstyle, linewidth=linewidth, alpha=0.8)
-                all_values.extend(valid_points)  # Only add valid points to all_values for axis scaling
-                
-            ax.grid(True); ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1), fontsize='small')
-            ax.tick_params(axis='x', rotation=30, labelsize='small')
-            # Friendly time axis formatting
-            locator = mdates.AutoDateLocator(minticks=3, maxticks=8)
-            ax.xaxis.set_major_locator(locator)
-            ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
-            
-            valid_values = [v for v in all_values if v is not None and not np.isnan(v)]
-            if not valid_values:
-                ax.text(0.5, 0.5, 'No Data Available', horizontalalignment='center', 
-                       verticalalignment='center', transform=ax.transAxes)
-                return
-
-            # Intelligent y-axis scaling based on data characteristics
-            min_val, max_val = min(valid_values), max(valid_values)
-            if center_y:
-                if max_val > min_val:
-                    # Values vary - use 10% margin
-                    margin = (max_val - min_val) * 0.1
-                else:
-                    # Constant value - use percentage of absolute value or minimum visible range
-                    if abs(min_val) > 10:
-                        # For large values (like offsets in millions), use 0.1% margin
-                        margin = abs(min_val) * 0.001
-                    else:
-                        # For small values near zero, use fixed small margin
-                        margin = max(1.0, abs(min_val) * 0.1)
-                ax.set_ylim(bottom=min_val - margin, top=max_val + margin)
-            else:
-                # For non-centered (like lag metrics), ensure we can see the lines
-                if max_val == min_val:
-                    # Constant value - add visible margin above and below
-                    if min_val == 0:
-                        # For zero, center it in view with equal margins above and below
-                        ax.set_ylim(bottom=-0.5, top=0.5)
-                    elif min_val < 10:
-                        # For small values, use symmetric range around the value
-                        margin = max(abs(min_val) * 0.5, 2.0)
-                        ax.set_ylim(bottom=min_val - margin, top=min_val + margin)
-                    else:
-                        margin = max(abs(min_val) * 0.1, 1.0)
-                        ax.set_ylim(bottom=max(0, min_val - margin), top=min_val + margin)
-                else:
-                    ax.autoscale(enable=True, axis='y')
-            # Prefer integer ticks for discrete/count metrics
-            if any(kw in ylabel.lower() for kw in ['count', 'epoch', 'state', 'offset', 'lag']):
-                ax.yaxis.set_major_locator(mticker.MaxNLocator(integer=True))
+        # Plot against precomputed matplotlib date numbers (no per-call conversion)
+        timestamps_num = data['timestamps_num']
+        # Each entry describes one PNG; they are rendered together at the end
+        figures = []
+        saved_messages = []
 
         # --- BROKER GRAPHS ---
         # Define all broker plots with their configurations
         broker_plots = [
-            ('Broker RTT', 'RTT (ms)', {k: v['rtt'] for k, v in data['brokers'].items()}, 'default', True),
-            ('Broker Data Rate (TX)', 'MB/s', {k: v['tx_rate'] for k, v in data['brokers'].items()}),
-            ('Broker Data Rate (RX)', 'MB/s', {k: v['rx_rate'] for k, v in data['brokers'].items()}),
-            ('Broker Connections', 'Count', {k: v['connects'] for k, v in data['brokers'].items()}),
-            ('Broker Disconnections', 'Count', {k: v['disconnects'] for k, v in data['brokers'].items()}),
-            ('Broker Throttle Time', 'Throttle (ms)', {k: v['throttle'] for k, v in data['brokers'].items()}),
-            ('Broker Receive Errors', 'Cumulative Errors', {k: v['rxerrs'] for k, v in data['brokers'].items()}),
-            ('Broker State', 'State', {k: v['state'] for k, v in data['brokers'].items()}, 'steps-post'),
+            ('Broker RTT', 'RTT (ms)', 'rtt', 'default', True),
+            ('Broker Data Rate (TX)', 'MB/s', 'tx_rate'),
+            ('Broker Data Rate (RX)', 'MB/s', 'rx_rate'),
+            ('Broker Connections', 'Count', 'connects'),
+            ('Broker Disconnections', 'Count', 'disconnects'),
+            ('Broker Throttle Time', 'Throttle (ms)', 'throttle'),
+            ('Broker Receive Errors', 'Cumulative Errors', 'rxerrs'),
+            ('Broker State', 'State', 'state', 'steps-post'),
         ]
         
-        # Create multi-subplot figure for all broker metrics
-        fig_b, axes_b = plt.subplots(len(broker_plots), 1, figsize=(15, 6 * len(broker_plots)), sharex=True)
-        if len(broker_plots) == 1: axes_b = [axes_b]
-        
-        for i, plot_def in enumerate(broker_plots):
-            title, ylabel, d_map, *rest = plot_def
+        # One subplot per broker metric, all in a single figure
+        broker_subplots = []
+        for plot_def in broker_plots:
+            title, ylabel, metric, *rest = plot_def
+            d_map = {k: v[metric] for k, v in data['brokers'].items()}
             style, center = (rest[0], rest[1]) if len(rest) > 1 else (rest[0] if rest else 'default', False)
-            ax = axes_b[i]
             
             # Filter out empty series unless show_empty is True
+            # (series are already float64 arrays, so no conversion is needed)
             if not show_empty:
-                d_map = {k: v for k, v in d_map.items() if any(vv is not None and not np.isnan(vv) for vv in v)}
+                d_map = {k: v for k, v in d_map.items() if not np.isnan(v).all()}
+            
+            subplot = dict(title=title, ylabel=ylabel, data_map=d_map, drawstyle=style, center_y=center,
+                           name_transform=_pretty_broker_label, show_valid=legend_valid, linewidth=line_width)
             
-            plot_data(ax, title, ylabel, d_map, drawstyle=style, center_y=center, 
-                     name_transform=pretty_broker_label, show_valid=legend_valid, linewidth=line_width)
+            # Series statistics are shared by the annotation and the debug files
+            plot_stats = self._series_stats(d_map) if annotate or debug else None
             
             # Add small annotation with series statistics
             if annotate:
-                stats_display = self._series_stats(d_map)
-                constants = sum(1 for s in stats_display.values() if s['valid'] > 0 and s['constant'])
-                ax.text(0.01, 0.02, f"series:{len(d_map)} const:{constants}", 
-                       transform=ax.transAxes, fontsize='x-small', alpha=0.7)
+                constants = sum(1 for s in plot_stats.values() if s['valid'] > 0 and s['constant'])
+                subplot['annotation'] = f"series:{len(d_map)} const:{constants}"
             
             # Write detailed debug files if requested
             if debug:
-                self._write_plot_debug(title, timestamps, d_map, os.path.join(debug_dir, 'brokers'))
+                self._write_plot_debug(title, timestamps, d_map, broker_debug_dir, plot_stats, debug_format,
+                                       integer_values=metric not in _FLOAT_METRICS)
             
             # Set y-axis lower bound to 0 for rate/count metrics
             if not center and ('Rate' in title or 'Errors' in title or 'Count' in title or 'Throttle' in title):
-                ax.set_ylim(bottom=0)
+                subplot['ylim_bottom'] = 0
             
             # Special handling for broker state plot (discrete values)
             if title == 'Broker State':
-                ax.set_yticks([-1, 0, 1])
-                ax.set_yticklabels(['DOWN', 'INIT', 'UP'])
-                ax.set_ylim(bottom=-1.5, top=1.5)
+                subplot['state_ticks'] = True
+            broker_subplots.append(subplot)
         
-        # Save broker metrics figure
-        fig_b.tight_layout(rect=[0, 0, 0.85, 0.98])
         broker_output_path = os.path.join(output_dir, "broker_metrics.png")
-        fig_b.savefig(broker_output_path)
-        plt.close(fig_b)
-        print(f"Saved broker metrics to {broker_output_path}")
+        figures.append({'path': broker_output_path, 'figsize': (15, 6 * len(broker_plots)),
+                        'x': timestamps_num, 'subplots': broker_subplots})
+        saved_messages.append(f"Saved broker metrics to {broker_output_path}")
 
         # --- TOPIC GRAPHS (Consumer metrics only) ---
         if data['client_type'] == 'consumer':
             for topic_name, partition_data in data['topics'].items():
                 if not partition_data: continue
                 topic_plots = [
-                    ('Committed Offset', 'Offset', {p: d['committed'] for p, d in partition_data.items()}, True),
-                    ('Stored Offset', 'Offset', {p: d['stored'] for p, d in partition_data.items()}, True),
-                    ('Committed Leader Epoch', 'Epoch', {p: d['leader_epoch'] for p, d in partition_data.items()}, True),
-                    ('Consumer Lag', 'Lag (Messages)', {p: d['lag'] for p, d in partition_data.items()}),
-                    ('Stored Consumer Lag', 'Lag (Messages)', {p: d['lag_stored'] for p, d in partition_data.items()}),
+                    ('Committed Offset', 'Offset', 'committed', True),
+                    ('Stored Offset', 'Offset', 'stored', True),
+                    ('Committed Leader Epoch', 'Epoch', 'leader_epoch', True),
+                    ('Consumer Lag', 'Lag (Messages)', 'lag'),
+                    ('Stored Consumer Lag', 'Lag (Messages)', 'lag_stored'),
                 ]
-                fig_t, axes_t = plt.subplots(len(topic_plots), 1, figsize=(15, 5 * len(topic_plots)), sharex=True)
-                if len(topic_plots) == 1: axes_t = [axes_t]
-                for i, plot_def in enumerate(topic_plots):
-                    title, ylabel, d_map, *rest = plot_def
+                topic_subplots = []
+                for plot_def in topic_plots:
+                    title, ylabel, metric, *rest = plot_def
                     center = rest[0] if rest else False
-                    ax = axes_t[i]
                     # Human-friendly partition labels with leader when available
                     clean_d_map = {}
-                    for k, v in d_map.items():
+                    for k, d in partition_data.items():
                         pid = k.rsplit('-', 1)[1]
-                        leader = partition_data[k].get('leader_last')
+                        leader = d.get('leader_last')
                         label = f"Partition {pid}" + (f" (Leader {leader})" if leader is not None else "")
-                        clean_d_map[label] = v
+                        clean_d_map[label] = d[metric]
                     # Filter empties if requested (but keep "Not Assigned" partitions to show them)
                     full_map = clean_d_map
                     if not show_empty:
                         # Keep series that have valid data OR are "Not Assigned" (-1 or -1001)
-                        clean_d_map = {k: v for k, v in full_map.items() 
-                                      if any(vv is not None and not np.isnan(vv) for vv in v)}
-                    plot_data(ax, f"{topic_name}: {title}", ylabel, clean_d_map, center_y=center, show_valid=legend_valid, linewidth=line_width)
+                        clean_d_map = {k: v for k, v in full_map.items() if not np.isnan(v).all()}
+                    subplot = dict(title=f"{topic_name}: {title}", ylabel=ylabel, data_map=clean_d_map,
+                                   center_y=center, show_valid=legend_valid, linewidth=line_width)
+                    plot_stats = self._series_stats(clean_d_map) if annotate or debug else None
                     if annotate:
-                        stats_display = self._series_stats(clean_d_map)
-                        constants = sum(1 for s in stats_display.values() if s['valid'] > 0 and s['constant'])
+                        constants = sum(1 for s in plot_stats.values() if s['valid'] > 0 and s['constant'])
                         hidden = len(full_map) - len(clean_d_map)
-                        ax.text(0.01, 0.02, f"series:{len(clean_d_map)} hidden:{hidden} const:{constants}", transform=ax.transAxes, fontsize='x-small', alpha=0.7)
+                        subplot['annotation'] = f"series:{len(clean_d_map)} hidden:{hidden} const:{constants}"
                     if debug:
-                        self._write_plot_debug(f"{topic_name}: {title}", timestamps, clean_d_map, os.path.join(debug_dir, 'topics'))
-                    if not center: ax.set_ylim(bottom=0)
-                fig_t.tight_layout(rect=[0, 0, 0.85, 0.98]); topic_output_path = os.path.join(output_dir, f"topic_{topic_name.replace('.', '_')}.png")
-                fig_t.savefig(topic_output_path); plt.close(fig_t); print(f"Saved topic metrics for {topic_name} to {topic_output_path}")
+                        self._write_plot_debug(f"{topic_name}: {title}", timestamps, clean_d_map, topic_debug_dir,
+                                               plot_stats, debug_format, integer_values=metric not in _FLOAT_METRICS)
+                    if not center: subplot['ylim_bottom'] = 0
+                    topic_subplots.append(subplot)
+                topic_output_path = os.path.join(output_dir, f"topic_{topic_name.replace('.', '_')}.png")
+                figures.append({'path': topic_output_path, 'figsize': (12, 4 * len(topic_plots)),
+                                'x': timestamps_num, 'subplots': topic_subplots})
+                saved_messages.append(f"Saved topic metrics for {topic_name} to {topic_output_path}")
+
+        # Figures are independent and rendering is CPU-bound, so fan them out
+        workers = min((os.cpu_count() or 1) if max_workers is None else max_workers, len(figures))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(_render_figure, figures))
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Parallel rendering unavailable ({e}); rendering serially.")
+                workers = 1
+        if workers <= 1:
+            # Figures are reused within this call only, so the last one drawn
+            # (and the series it references) is released afterwards
+            figure_cache: Dict[tuple, Any] = {}
+            for spec in figures:
+                _render_figure(spec, self._downsample_cache, figure_cache)
+            figure_cache.clear()
+        for message in saved_messages:
+            print(message)
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse a command-line value that must be an integer of at least 1.
+    
+    Args:
+        value: Raw argument string
+        
+    Returns:
+        The parsed integer
+        
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer or is below 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -860,6 +1440,8 @@ Examples:
                        help="Output directory name for the graphs (default: kafka_graphs).")
     parser.add_argument("--debug-data", action="store_true", 
                        help="Write the parsed time-series data and per-plot CSVs/summaries for debugging.")
+    parser.add_argument("--debug-format", choices=_DEBUG_FORMATS, default="csv", 
+                       help="Format of the per-plot debug values files (default: csv; parquet requires polars).")
     parser.add_argument("--show-empty", action="store_true", 
                        help="Include series with zero valid points in plots (default hides them).")
     parser.add_argument("--no-legend-valid", action="store_true", 
@@ -868,8 +1450,13 @@ Examples:
                        help="Disable small per-plot annotations (series/hidden/const counts).")
     parser.add_argument("--line-width", type=float, default=3.0, 
                        help="Line width for plots in points (default: 3.0).")
+    parser.add_argument("--jobs", type=_positive_int, default=None, 
+                       help="Number of processes used to render graphs, at least 1; 1 renders "
+                            "serially (default: number of CPUs).")
     
     args = parser.parse_args()
+    if args.debug_format == "parquet" and importlib.util.find_spec("polars") is None:
+        parser.error("--debug-format parquet requires polars (pip install polars)")
 
     # Parse the statistics file
     stats_parser = LibrdKafkaStatsParser(args.stats_file)
@@ -888,6 +1475,8 @@ Examples:
             legend_valid=not args.no_legend_valid,
             annotate=not args.no_annotate,
             line_width=args.line_width,
+            max_workers=args.jobs,
+            debug_format=args.debug_format,
         )
 
 
@@ -0,0 +1,218 @@
+"""
+Regression tests for kafka_stats_parser.
+
+Run from the repository root with:
+    python -m unittest discover -s tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kafka_stats_parser as ksp  # noqa: E402
+
+
+def _topic_spec(path, x, data_maps):
+    """Build a _render_figure spec with one subplot per data map."""
+    return {
+        'path': path,
+        'figsize': (12, 4 * len(data_maps)),
+        'x': x,
+        'subplots': [{'title': f"plot {i}", 'ylabel': 'Offset', 'data_map': data_map}
+                     for i, data_map in enumerate(data_maps)],
+    }
+
+
+def _write_stats(path, snapshots=60, late_topic_from=50):
+    """
+    Write newline-delimited stats with topic 'a' throughout and topic 'b'
+    only in the last snapshots, with its offsets and epoch Not Assigned.
+    """
+    records = []
+    for i in range(snapshots):
+        t = 1700000000 + 60 * i
+        topics = {'a': {'topic': 'a', 'partitions': {'0': {
+            'partition': 0, 'leader': 0, 'consumer_lag': i, 'consumer_lag_stored': i,
+            'committed_offset': 10000000000 + 50 * i, 'stored_offset': 10000000000 + 50 * i,
+            'committed_leader_epoch': 3}}}}
+        if i >= late_topic_from:
+            topics['b'] = {'topic': 'b', 'partitions': {'0': {
+                'partition': 0, 'leader': 0, 'consumer_lag': i, 'consumer_lag_stored': i,
+                'committed_offset': -1001, 'stored_offset': -1001, 'committed_leader_epoch': -1}}}
+        records.append({
+            'name': 'rdkafka#consumer-1', 'type': 'consumer', 'ts': t * 1000000, 'time': t,
+            'brokers': {'host:9092/0': {'name': 'host:9092/0', 'source': 'learned', 'state': 'UP',
+                                        'rxbytes': 100 * i, 'txbytes': 50 * i, 'rtt': {'avg': 1000 + i}}},
+            'topics': topics,
+        })
+    with open(path, 'w') as f:
+        f.write('\n'.join(json.dumps(r) for r in records))
+
+
+def _record(i, partitions=3):
+    """One consumer snapshot, spanning many lines when pretty-printed."""
+    return {
+        'name': 'rdkafka#consumer-1', 'type': 'consumer', 'time': 1700000000 + i,
+        'brokers': {'host:9092/0': {'name': 'host:9092/0', 'state': 'UP', 'rtt': {'avg': 1000 + i}}},
+        'topics': {'a': {'topic': 'a', 'partitions': {
+            str(p): {'partition': p, 'consumer_lag': i, 'committed_offset': 100 + i} for p in range(partitions)}}},
+    }
+
+
+class IterJsonValuesTest(unittest.TestCase):
+    """Record counts for each supported input layout."""
+    n = 40
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.records = [_record(i, partitions=1 + i % 7) for i in range(self.n)]
+
+    def _times(self, content: str):
+        path = os.path.join(self.tmp.name, 'stats.json')
+        with open(path, 'w', newline='') as f:
+            f.write(content)
+        return [s.time for s in ksp.LibrdKafkaStatsParser(path).stats_history]
+
+    def _pretty(self):
+        return '\n'.join(json.dumps(r, indent=2) for r in self.records)
+
+    def assertTimes(self, content, count):
+        self.assertEqual(self._times(content), [1700000000 + i for i in range(count)])
+
+    def test_ndjson(self):
+        self.assertTimes('\n'.join(json.dumps(r) for r in self.records) + '\n', self.n)
+
+    def test_ndjson_crlf(self):
+        self.assertTimes('\r\n'.join(json.dumps(r) for r in self.records) + '\r\n', self.n)
+
+    def test_pretty_printed_concatenated(self):
+        self.assertTimes(self._pretty(), self.n)
+
+    def test_pretty_printed_array(self):
+        self.assertTimes(json.dumps(self.records, indent=2), self.n)
+
+    def test_array_followed_by_objects(self):
+        half = self.n // 2
+        content = json.dumps(self.records[:half], indent=2) + '\n' + '\n'.join(
+            json.dumps(r, indent=2) for r in self.records[half:])
+        self.assertTimes(content, self.n)
+
+    def test_back_to_back_without_newline(self):
+        self.assertTimes(''.join(json.dumps(r) for r in self.records), self.n)
+
+    def test_large_value_spanning_many_lines(self):
+        # One record far larger than the others exercises the retry-on-doubling path
+        self.records[self.n // 2] = _record(self.n // 2, partitions=500)
+        self.assertTimes(self._pretty(), self.n)
+
+    def test_truncated_last_record_is_dropped(self):
+        ndjson = '\n'.join(json.dumps(r) for r in self.records)
+        self.assertTimes(ndjson[:-20], self.n - 1)
+        pretty = self._pretty()
+        self.assertTimes(pretty[:-20], self.n - 1)
+
+
+class LoadStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _load(self, records):
+        path = os.path.join(self.tmp.name, 'stats.json')
+        with open(path, 'w') as f:
+            f.write('\n'.join(json.dumps(r) for r in records))
+        return ksp.LibrdKafkaStatsParser(path).stats_history
+
+    def test_duplicate_record_with_null_sections_is_merged(self):
+        first = {'name': 'c', 'type': 'consumer', 'time': 1700000000,
+                 'brokers': {'host:9092/0': {'name': 'host:9092/0', 'state': 'UP'}},
+                 'topics': {'a': {'topic': 'a', 'partitions': {'0': {'partition': 0}}}}}
+        duplicates = [
+            {'name': 'c', 'type': 'consumer', 'time': 1700000000, 'topics': None, 'brokers': None},
+            {'name': 'c', 'type': 'consumer', 'time': 1700000000,
+             'topics': {'a': {'topic': 'a', 'partitions': None}}},
+        ]
+        history = self._load([first] + duplicates)
+        self.assertEqual(len(history), 1)
+        self.assertEqual(list(history[0].topics), ['a'])
+        self.assertEqual(list(history[0].topics['a'].partitions), ['0'])
+        self.assertEqual(list(history[0].brokers), ['host:9092/0'])
+
+
+class RenderFigureTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    @staticmethod
+    def _xlims(figure_cache, spec):
+        _, axes = figure_cache[(tuple(spec['figsize']), len(spec['subplots']))]
+        return [ax.get_xlim() for ax in axes]
+
+    def test_reused_figure_does_not_keep_previous_x_range(self):
+        # Second topic: one axes with only "Not Assigned" values, one with data
+        # in a later, shorter time range than the first topic
+        x_first = np.arange(60, dtype=np.float64) / 1440 + 19000
+        x_second = x_first[50:]
+        first = _topic_spec(os.path.join(self.tmp.name, 'first.png'), x_first,
+                            [{'p0': np.arange(60.0)}, {'p0': np.arange(60.0)}])
+        second = _topic_spec(os.path.join(self.tmp.name, 'second.png'), x_second,
+                             [{'p0': np.full(10, -1001.0)}, {'p0': np.arange(10.0)}])
+
+        reused = {}
+        ksp._render_figure(first, figure_cache=reused)
+        ksp._render_figure(second, figure_cache=reused)
+        fresh = {}
+        ksp._render_figure(second, figure_cache=fresh)
+        self.assertEqual(self._xlims(reused, second), self._xlims(fresh, second))
+
+
+class GenerateGraphsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.stats_file = os.path.join(self.tmp.name, 'stats.json')
+        _write_stats(self.stats_file)
+
+    def _render(self, name, max_workers):
+        output_dir = os.path.join(self.tmp.name, name)
+        ksp.LibrdKafkaStatsParser(self.stats_file).generate_graphs(output_dir, max_workers=max_workers)
+        pngs = {}
+        for filename in sorted(os.listdir(output_dir)):
+            with open(os.path.join(output_dir, filename), 'rb') as f:
+                pngs[filename] = f.read()
+        return pngs
+
+    def test_unknown_debug_format_is_rejected_before_writing(self):
+        output_dir = os.path.join(self.tmp.name, 'out')
+        with self.assertRaises(ValueError):
+            ksp.LibrdKafkaStatsParser(self.stats_file).generate_graphs(output_dir, debug=True, debug_format='xlsx')
+        self.assertFalse(os.path.exists(output_dir))
+
+    def test_parquet_without_polars_fails_before_writing(self):
+        output_dir = os.path.join(self.tmp.name, 'out')
+        with mock.patch.dict(sys.modules, {'polars': None}):
+            with self.assertRaises(ImportError):
+                ksp.LibrdKafkaStatsParser(self.stats_file).generate_graphs(output_dir, debug=True,
+                                                                           debug_format='parquet')
+        self.assertFalse(os.path.exists(output_dir))
+
+    def test_serial_and_parallel_output_match(self):
+        serial = self._render('serial', max_workers=1)
+        parallel = self._render('parallel', max_workers=3)
+        self.assertEqual(sorted(serial), ['broker_metrics.png', 'topic_a.png', 'topic_b.png'])
+        self.assertEqual(sorted(serial), sorted(parallel))
+        for filename in serial:
+            self.assertEqual(serial[filename], parallel[filename], filename)
+
+
+if __name__ == '__main__':
+    unittest.main()